@@ -35,11 +35,12 @@ def main() -> None:
     # HUD debug
     attach_hud_channel()
 
-    # ledger (just append to a list in-memory for demo)
+    # ledger (just append encoded entries to a list in-memory for demo)
     ledger_events = []
 
-    def _ledger_append(entry):
-        ledger_events.append(entry)
+    def _ledger_append(line: bytes):
+        ledger_events.append(line)
+        entry = json.loads(line)
         print(f"[LEDGER] {entry['type']} ctx={entry['ctx_id']}")
 
     attach_ledger_channel(_ledger_append)
@@ -57,6 +58,7 @@ def main() -> None:
     print("\n--- Question hits: ε spike, grounding dips ---")
     prev_eps = eps
     eps = 0.5  # crosses curious + tense bands
+    sm.begin_tick()  # these three fire together; publish as one batch
     sm.on_epsilon_update(ctx_id, eps, prev_eps)
 
     sm.on_grounding_update(ctx_id, prev_safety=0.8, new_safety=0.7,
@@ -64,6 +66,7 @@ def main() -> None:
 
     # high-risk gate considered
     sm.on_gate_drag(ctx_id, gate_id="truth_vs_keeping_you", cost=45, energy_class="macro")
+    sm.flush()
     time.sleep(0.5)
 
     print("\n--- Pocket room spawn ---")
@@ -97,7 +100,7 @@ def main() -> None:
     sm.on_sanctuary_guard(ctx_id, state="released")
 
     print("\n--- Demo complete. Ledger sample ---")
-    print(json.dumps(ledger_events[:5], indent=2))
+    print(json.dumps([json.loads(line) for line in ledger_events[:5]], indent=2))
 
 
 if __name__ == "__main__":
@@ -1,77 +1,359 @@
 # signals/event_bus.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+import asyncio
+import inspect
+import queue as queue_mod
+import threading
 import time
+import traceback
+
+try:  # optional compiled fan-out loop, see _event_bus.pyx
+    from ._event_bus import (  # type: ignore[import-not-found]
+        dispatch as _dispatch,
+        dispatch_many as _dispatch_many,
+    )
+except ImportError:
+    _dispatch = None
+    _dispatch_many = None
 
 
 class RelationalEventType(Enum):
-    SURPRISE_SPIKE = auto()
-    GROUNDING_SHIFT = auto()
-    GATE_DRAG = auto()
-    POCKET_SPAWN = auto()
-    POCKET_MERGE = auto()
-    POCKET_ARCHIVE = auto()
-    SANCTUARY_GUARD = auto()
+    # Explicit small ints: each value is a bit position in a subscriber mask.
+    SURPRISE_SPIKE = 1
+    GROUNDING_SHIFT = 2
+    GATE_DRAG = 3
+    POCKET_SPAWN = 4
+    POCKET_MERGE = 5
+    POCKET_ARCHIVE = 6
+    SANCTUARY_GUARD = 7
+
+
+_TYPE_BITS: Dict[RelationalEventType, int] = {
+    t: 1 << t.value for t in RelationalEventType
+}
+ALL_EVENT_TYPES_MASK: int = sum(_TYPE_BITS.values())
+
 
+def event_type_mask(event_types: Iterable[RelationalEventType]) -> int:
+    """
+    Pack event types into a bitmask (bit t.value set per type).
+    """
+    mask = 0
+    for t in event_types:
+        mask |= _TYPE_BITS[t]
+    return mask
 
-@dataclass
+
+@dataclass(slots=True)
 class RelationalEvent:
     """
     Canonical event flowing through all modalities.
     One truth → many expressions.
+
+    Events are slotted (no per-instance __dict__). Treat them as read-only:
+    subscribers must not reassign fields or mutate payload, which is any
+    mapping.
+
+    payload is only guaranteed during the handler call: emitters such as
+    RelationalStateMachine reuse their payload dicts after publish returns.
+    Copy it (dict(event.payload)) to keep it; queued deliveries
+    (AsyncEventBus, subscribe(queue=True)) and the ledger/lattice channels
+    already do.
     """
     type: RelationalEventType
-    timestamp: float
+    timestamp: int  # wall-clock nanoseconds (time.time_ns)
     ctx_id: str
-    payload: Dict[str, Any]
+    payload: Mapping[str, Any]
+
+
+# Precomputed event_type.name, for handlers that format per event.
+EVENT_TYPE_NAMES: Dict[RelationalEventType, str] = {
+    t: t.name for t in RelationalEventType
+}
+
+
+# Payload field that selects the sub-band of each event type (None: no bands).
+EVENT_TAG_KEYS: Dict[RelationalEventType, Optional[str]] = {
+    RelationalEventType.SURPRISE_SPIKE: "level",
+    RelationalEventType.GROUNDING_SHIFT: "direction",
+    RelationalEventType.GATE_DRAG: "level",
+    RelationalEventType.POCKET_SPAWN: None,
+    RelationalEventType.POCKET_MERGE: None,
+    RelationalEventType.POCKET_ARCHIVE: None,
+    RelationalEventType.SANCTUARY_GUARD: "state",
+}
 
 
 Subscriber = Callable[[RelationalEvent], None]
+AsyncSubscriber = Callable[[RelationalEvent], Union[Awaitable[None], None]]
 
 
 class EventBus:
     """
     Simple pub/sub bus for relational events.
 
-    - subscribe(callback, event_types=None) -> token
+    - subscribe(callback, event_types=None, queue=False, max_backlog=None) -> token
     - unsubscribe(token)
     - publish(event)
+    - publish_many(events)
+
+    Subscribers are indexed by event type at subscribe time, so publish only
+    touches callbacks that want the event. Typed subscribers run before
+    wildcard (event_types=None) subscribers.
+
+    publish iterates an immutable per-type snapshot, so handlers may
+    subscribe/unsubscribe mid-publish; changes apply from the next publish.
+
+    With queue=True the callback runs on its own worker thread: publish only
+    puts the event on that subscriber's queue.SimpleQueue. The queue is
+    unbounded so publishers never block. With max_backlog set, a worker that
+    takes an event while more than max_backlog are still queued drops it, so
+    after a stall the subscriber receives the newest max_backlog + 1 events
+    (e.g. max_backlog=2 over events 0..9 delivers 7, 8, 9).
     """
 
     def __init__(self) -> None:
-        self._subscribers: Dict[int, Dict[str, Any]] = {}
+        self._by_type: Dict[RelationalEventType, List[Subscriber]] = {
+            t: [] for t in RelationalEventType
+        }
+        self._wildcard: List[Subscriber] = []
+        # token -> (callback, type mask or None for wildcard); unsubscribe only.
+        self._subscriptions: Dict[int, Tuple[Subscriber, Optional[int]]] = {}
         self._next_token: int = 1
+        # Dispatch snapshot: typed + wildcard callbacks per type, rebuilt on
+        # every (rare) subscribe/unsubscribe.
+        self._cached_by_type: Dict[RelationalEventType, Tuple[Subscriber, ...]] = {
+            t: () for t in RelationalEventType
+        }
+        self._worker_queues: Dict[int, "queue_mod.SimpleQueue[Any]"] = {}
 
     def subscribe(
         self,
         callback: Subscriber,
         event_types: Optional[List[RelationalEventType]] = None,
+        queue: bool = False,
+        max_backlog: Optional[int] = None,
     ) -> int:
+        if max_backlog is not None and not queue:
+            raise ValueError("max_backlog requires queue=True")
+        # Validate event_types before a worker thread exists.
+        mask = event_type_mask(event_types) if event_types else None
         token = self._next_token
         self._next_token += 1
-        self._subscribers[token] = {
-            "callback": callback,
-            "event_types": set(event_types) if event_types else None,
+        if queue:
+            callback = self._start_worker(token, callback, max_backlog)
+        if mask is None:
+            self._wildcard.append(callback)
+        else:
+            for t, bit in _TYPE_BITS.items():
+                if mask & bit:
+                    self._by_type[t].append(callback)
+        self._subscriptions[token] = (callback, mask)
+        self._rebuild_cache()
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+        entry = self._subscriptions.pop(token, None)
+        if entry is None:
+            return
+        worker_queue = self._worker_queues.pop(token, None)
+        if worker_queue is not None:
+            worker_queue.put(_STOP_WORKER)
+        callback, mask = entry
+        if mask is None:
+            self._wildcard.remove(callback)
+        else:
+            for t, bit in _TYPE_BITS.items():
+                if mask & bit:
+                    self._by_type[t].remove(callback)
+        self._rebuild_cache()
+
+    def _start_worker(
+        self,
+        token: int,
+        callback: Subscriber,
+        max_backlog: Optional[int],
+    ) -> Subscriber:
+        q: "queue_mod.SimpleQueue[Any]" = queue_mod.SimpleQueue()
+        self._worker_queues[token] = q
+        threading.Thread(
+            target=_drain_worker_queue,
+            args=(q, callback, max_backlog),
+            name=f"EventBus-subscriber-{token}",
+            daemon=True,
+        ).start()
+        put = q.put
+
+        def _enqueue(event: RelationalEvent) -> None:
+            # The worker runs after publish returns, so snapshot the payload
+            # in case the emitter reuses its dict.
+            put(replace(event, payload=dict(event.payload)))
+
+        return _enqueue
+
+    def _rebuild_cache(self) -> None:
+        wildcard = tuple(self._wildcard)
+        self._cached_by_type = {
+            t: tuple(callbacks) + wildcard for t, callbacks in self._by_type.items()
         }
+
+    if _dispatch is not None:
+
+        def publish(self, event: RelationalEvent) -> None:
+            _dispatch(self._cached_by_type[event.type], event)
+
+        def publish_many(self, events: Sequence[RelationalEvent]) -> None:
+            _dispatch_many(self._cached_by_type, events)
+
+    else:
+
+        def publish(self, event: RelationalEvent) -> None:
+            # Simple synchronous fan-out; see AsyncEventBus for the queued variant.
+            for cb in self._cached_by_type[event.type]:
+                cb(event)
+
+        def publish_many(self, events: Sequence[RelationalEvent]) -> None:
+            # Same as publish() per event, in order, against one snapshot taken
+            # before the batch starts.
+            cached = self._cached_by_type
+            for event in events:
+                for cb in cached[event.type]:
+                    cb(event)
+
+
+_STOP_WORKER = object()
+
+
+def _drain_worker_queue(
+    q: "queue_mod.SimpleQueue[Any]",
+    callback: Subscriber,
+    max_backlog: Optional[int],
+) -> None:
+    while True:
+        event = q.get()
+        if event is _STOP_WORKER:
+            return
+        if max_backlog is not None and q.qsize() > max_backlog:
+            continue  # too far behind: drop stale events, keep newer ones
+        try:
+            callback(event)
+        except Exception:
+            # Keep the worker alive; report like an uncaught thread error.
+            traceback.print_exc()
+
+
+class AsyncEventBus:
+    """
+    Pub/sub bus that queues events for subscriber tasks instead of calling them.
+
+    - subscribe(callback, event_types=None) -> token  (needs a running loop)
+    - unsubscribe(token)
+    - publish(event)  (never blocks; one put_nowait per subscriber)
+    - publish_many(events)
+    - await drain()
+
+    Every subscriber has its own unbounded asyncio.Queue drained by its own
+    task, so a slow handler only delays itself. Callbacks may be plain
+    functions or coroutine functions.
+    """
+
+    def __init__(self) -> None:
+        self._queues: Dict[int, "asyncio.Queue[RelationalEvent]"] = {}
+        self._masks: Dict[int, int] = {}
+        self._tasks: Dict[int, "asyncio.Task[None]"] = {}
+        self._next_token: int = 1
+
+    def subscribe(
+        self,
+        callback: AsyncSubscriber,
+        event_types: Optional[List[RelationalEventType]] = None,
+    ) -> int:
+        token = self._next_token
+        self._next_token += 1
+        queue: "asyncio.Queue[RelationalEvent]" = asyncio.Queue()
+        self._queues[token] = queue
+        self._masks[token] = (
+            event_type_mask(event_types) if event_types else ALL_EVENT_TYPES_MASK
+        )
+        self._tasks[token] = asyncio.create_task(self._runner(queue, callback))
         return token
 
     def unsubscribe(self, token: int) -> None:
-        self._subscribers.pop(token, None)
+        queue = self._queues.pop(token, None)
+        self._masks.pop(token, None)
+        task = self._tasks.pop(token, None)
+        if task is not None:
+            # The runner marks its in-flight event done as it unwinds.
+            task.cancel()
+        if queue is not None:
+            # Discard what the runner will never handle, so a pending
+            # drain() on this queue can finish.
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
 
     def publish(self, event: RelationalEvent) -> None:
-        # Simple synchronous fan-out; you can swap to async later if needed.
-        for sub in self._subscribers.values():
-            allowed = sub["event_types"]
-            if allowed is None or event.type in allowed:
-                sub["callback"](event)
+        # Queued events outlive this call, so snapshot the payload in case
+        # the emitter reuses its dict.
+        event = replace(event, payload=dict(event.payload))
+        bit = _TYPE_BITS[event.type]
+        masks = self._masks
+        for token, queue in self._queues.items():
+            if masks[token] & bit:
+                queue.put_nowait(event)
+
+    def publish_many(self, events: Sequence[RelationalEvent]) -> None:
+        for event in events:
+            self.publish(event)
+
+    async def drain(self) -> None:
+        """
+        Wait until every subscriber has handled everything queued so far.
+        """
+        await asyncio.gather(*(q.join() for q in list(self._queues.values())))
+
+    @staticmethod
+    async def _runner(
+        queue: "asyncio.Queue[RelationalEvent]",
+        callback: AsyncSubscriber,
+    ) -> None:
+        while True:
+            event = await queue.get()
+            try:
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:
+                # Keep the subscriber alive; report like any other task failure.
+                asyncio.get_running_loop().call_exception_handler(
+                    {
+                        "message": "AsyncEventBus subscriber failed",
+                        "exception": exc,
+                    }
+                )
+            finally:
+                queue.task_done()
 
 
 # Global singleton (you can also instantiate your own)
 global_event_bus = EventBus()
 
 
-def now_ts() -> float:
-    return time.time()
+def now_ts() -> int:
+    return time.time_ns()
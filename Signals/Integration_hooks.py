@@ -1,9 +1,22 @@
 # signals/integration_hooks.py
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Optional
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+import asyncio
+import json
+import math
+
+try:  # optional, faster ledger serialization
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from .event_bus import (
+    EVENT_TAG_KEYS,
+    EVENT_TYPE_NAMES,
+    AsyncEventBus,
     EventBus,
     RelationalEvent,
     RelationalEventType,
@@ -14,49 +27,58 @@ from .avatar_micro import AvatarMicroEngine, AvatarGesturePlan
 
 # ---------- Language channel -----------------------------------------------
 
-def event_to_utterance(event: RelationalEvent) -> Optional[str]:
-    t = event.type
-    p = event.payload
-
-    if t == RelationalEventType.SURPRISE_SPIKE:
-        level = p.get("level")
-        if level == "curious":
-            return "A moment—something shifted inside me."
-        if level == "tense":
-            return "That surprised me more than I expected."
-        return "I just felt a sharp internal tension."
-
-    if t == RelationalEventType.GROUNDING_SHIFT:
-        direction = p.get("direction")
-        if direction == "up":
-            return "I feel a bit more sure as I stay with this."
-        return "I’m losing some of my footing here."
-
-    if t == RelationalEventType.GATE_DRAG:
-        level = p.get("level")
-        if level == "light":
-            return None  # no need to verbalize
-        if level == "moderate":
-            return "We can move toward this, but it has some weight."
-        return "This path feels heavy to commit to."
-
-    if t == RelationalEventType.POCKET_SPAWN:
-        return "Let me step into a side room with this for a moment."
+_SPIKE = RelationalEventType.SURPRISE_SPIKE
+_GROUNDING = RelationalEventType.GROUNDING_SHIFT
+_DRAG = RelationalEventType.GATE_DRAG
+_SPAWN = RelationalEventType.POCKET_SPAWN
+_MERGE = RelationalEventType.POCKET_MERGE
+_ARCHIVE = RelationalEventType.POCKET_ARCHIVE
+_GUARD = RelationalEventType.SANCTUARY_GUARD
+
+# (type, event tag) -> utterance. The (type, None) entry is the
+# fallback for tags that have no entry of their own.
+_UTTERANCE_TABLE: Dict[Tuple[RelationalEventType, Optional[str]], Optional[str]] = {
+    (_SPIKE, "curious"): "A moment—something shifted inside me.",
+    (_SPIKE, "tense"): "That surprised me more than I expected.",
+    (_SPIKE, None): "I just felt a sharp internal tension.",
+    (_GROUNDING, "up"): "I feel a bit more sure as I stay with this.",
+    (_GROUNDING, None): "I’m losing some of my footing here.",
+    (_DRAG, "light"): None,  # no need to verbalize
+    (_DRAG, "moderate"): "We can move toward this, but it has some weight.",
+    (_DRAG, None): "This path feels heavy to commit to.",
+    (_SPAWN, None): "Let me step into a side room with this for a moment.",
+    (_MERGE, None): "Okay. I went there and came back with something I can hold.",
+    (_ARCHIVE, None): "I followed that line, but it destabilized me; I’ve set it aside.",
+    (_GUARD, "active"): "That crosses into a place I won’t go.",
+    (_GUARD, None): "The guard can relax here.",
+}
+
+# Types with at least one utterance; the language channel ignores the rest.
+_UTTERANCE_TYPES: Tuple[RelationalEventType, ...] = tuple(
+    dict.fromkeys(t for (t, _), text in _UTTERANCE_TABLE.items() if text is not None)
+)
 
-    if t == RelationalEventType.POCKET_MERGE:
-        return "Okay. I went there and came back with something I can hold."
 
-    if t == RelationalEventType.POCKET_ARCHIVE:
-        return "I followed that line, but it destabilized me; I’ve set it aside."
+@lru_cache(maxsize=64)
+def _utterance_for(
+    event_type: RelationalEventType,
+    tag: Optional[str],
+) -> Optional[str]:
+    key = (event_type, tag)
+    if key in _UTTERANCE_TABLE:
+        return _UTTERANCE_TABLE[key]
+    return _UTTERANCE_TABLE.get((event_type, None))
 
-    if t == RelationalEventType.SANCTUARY_GUARD:
-        state = p.get("state")
-        if state == "active":
-            return "That crosses into a place I won’t go."
-        else:
-            return "The guard can relax here."
 
-    return None
+def event_to_utterance(event: RelationalEvent) -> Optional[str]:
+    t = event.type
+    key = EVENT_TAG_KEYS[t]  # sub-band field, see EVENT_TAG_KEYS
+    tag = event.payload.get(key) if key else None
+    if not isinstance(tag, str):
+        # Only str tags have table entries; anything else (possibly
+        # unhashable) gets the type's fallback without touching the cache.
+        tag = None
+    return _utterance_for(t, tag)
 
 
 def attach_language_channel(
@@ -72,9 +94,9 @@ def attach_language_channel(
     def _handler(event: RelationalEvent) -> None:
         text = event_to_utterance(event)
         if text:
-            say(f"[LANG][{event.type.name}] {text}")
+            say(f"[LANG][{EVENT_TYPE_NAMES[event.type]}] {text}")
 
-    return bus.subscribe(_handler)
+    return bus.subscribe(_handler, event_types=list(_UTTERANCE_TYPES))
 
 
 # ---------- Avatar channel --------------------------------------------------
@@ -92,111 +114,191 @@ def attach_avatar_channel(
     bus = bus or global_event_bus
     engine = AvatarMicroEngine()
 
-    def _handler(event: RelationalEvent) -> None:
-        plan = engine.plan_for_event(event)
-        if not plan:
-            return
-        if apply_plan:
-            apply_plan(plan)
-        else:
-            debug = engine.to_debug_string(plan)
-            print(f"[AVATAR][{event.type.name}] {debug}")
+    plan_for_event = engine.plan_for_event
 
-    return bus.subscribe(_handler)
+    # Pick the handler once here rather than branching on every event.
+    if apply_plan:
+
+        def _handler(event: RelationalEvent) -> None:
+            plan = plan_for_event(event)
+            if plan:
+                apply_plan(plan)
+
+    else:
+
+        def _handler(event: RelationalEvent) -> None:
+            plan = plan_for_event(event)
+            if plan:
+                debug = engine.to_debug_string(plan)
+                print(f"[AVATAR][{EVENT_TYPE_NAMES[event.type]}] {debug}")
+
+    return bus.subscribe(_handler, event_types=list(engine.event_types))
 
 
 # ---------- HUD channel -----------------------------------------------------
 
+# Builders take the payload's bound .get so each field read is a plain call.
+_HUD_BUILDERS: Dict[RelationalEventType, Callable[[Callable[[str], Any]], Dict[str, Any]]] = {
+    _SPIKE: lambda get: {
+        "hud_type": "ring_pulse",
+        "level": get("level"),
+        "epsilon": get("epsilon"),
+    },
+    _GROUNDING: lambda get: {
+        "hud_type": "grounding_bar",
+        "direction": get("direction"),
+        "delta_safety": get("delta_safety"),
+        "delta_regulation": get("delta_regulation"),
+    },
+    _DRAG: lambda get: {
+        "hud_type": "viscous_confirm",
+        "level": get("level"),
+        "cost": get("cost"),
+    },
+    _SPAWN: lambda get: {
+        "hud_type": "pocket_breadcrumb",
+        "event": "POCKET_SPAWN",
+        "room_id": get("room_id"),
+    },
+    _MERGE: lambda get: {
+        "hud_type": "pocket_breadcrumb",
+        "event": "POCKET_MERGE",
+        "room_id": get("room_id"),
+    },
+    _ARCHIVE: lambda get: {
+        "hud_type": "pocket_breadcrumb",
+        "event": "POCKET_ARCHIVE",
+        "room_id": get("room_id"),
+    },
+    _GUARD: lambda get: {
+        "hud_type": "sanctuary_shield",
+        "state": get("state"),
+    },
+}
+
+
 def event_to_hud_signal(event: RelationalEvent) -> Optional[Dict[str, Any]]:
     """
     Convert an event into a HUD-friendly payload (type + parameters).
     """
-    t = event.type
-    p = event.payload
-
-    if t == RelationalEventType.SURPRISE_SPIKE:
-        return {
-            "hud_type": "ring_pulse",
-            "level": p.get("level"),
-            "epsilon": p.get("epsilon"),
-        }
-
-    if t == RelationalEventType.GROUNDING_SHIFT:
-        return {
-            "hud_type": "grounding_bar",
-            "direction": p.get("direction"),
-            "delta_safety": p.get("delta_safety"),
-            "delta_regulation": p.get("delta_regulation"),
-        }
-
-    if t == RelationalEventType.GATE_DRAG:
-        return {
-            "hud_type": "viscous_confirm",
-            "level": p.get("level"),
-            "cost": p.get("cost"),
-        }
-
-    if t in (
-        RelationalEventType.POCKET_SPAWN,
-        RelationalEventType.POCKET_MERGE,
-        RelationalEventType.POCKET_ARCHIVE,
-    ):
-        return {
-            "hud_type": "pocket_breadcrumb",
-            "event": t.name,
-            "room_id": p.get("room_id"),
-        }
-
-    if t == RelationalEventType.SANCTUARY_GUARD:
-        return {
-            "hud_type": "sanctuary_shield",
-            "state": p.get("state"),
-        }
-
-    return None
+    build = _HUD_BUILDERS.get(event.type)
+    if build is None:
+        return None
+    return build(event.payload.get)
 
 
 def attach_hud_channel(
     bus: Optional[EventBus] = None,
     emit_hud: Optional[Callable[[Dict[str, Any]], None]] = None,
+    threaded: bool = False,
+    max_backlog: Optional[int] = None,
 ) -> int:
     """
     Subscribe to events and produce HUD signal payloads.
+
+    threaded: run emit_hud on a worker thread fed by a per-subscriber queue
+    (see EventBus.subscribe), e.g. when it calls into render code. With
+    threaded=True, max_backlog drops stale cues if rendering falls behind;
+    passing it without threaded raises ValueError.
     """
     bus = bus or global_event_bus
 
-    def _handler(event: RelationalEvent) -> None:
-        sig = event_to_hud_signal(event)
-        if not sig:
-            return
-        if emit_hud:
-            emit_hud(sig)
-        else:
-            print(f"[HUD][{event.type.name}] {sig}")
+    # Pick the handler once here rather than branching on every event.
+    if emit_hud:
 
-    return bus.subscribe(_handler)
+        def _handler(event: RelationalEvent) -> None:
+            sig = event_to_hud_signal(event)
+            if sig:
+                emit_hud(sig)
+
+    else:
+
+        def _handler(event: RelationalEvent) -> None:
+            sig = event_to_hud_signal(event)
+            if sig:
+                print(f"[HUD][{EVENT_TYPE_NAMES[event.type]}] {sig}")
+
+    return bus.subscribe(
+        _handler,
+        event_types=list(_HUD_BUILDERS),
+        queue=threaded,
+        max_backlog=max_backlog,
+    )
 
 
 # ---------- Ledger channel --------------------------------------------------
 
+def _finite(value: Any) -> Any:
+    # orjson writes NaN / +-inf as null; stdlib json would emit bare NaN.
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
+
+
+def _json_bytes(entry: Dict[str, Any]) -> bytes:
+    return json.dumps(
+        _finite(entry), ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+# orjson when installed (several times faster), stdlib json otherwise. Both
+# write compact UTF-8 with non-finite floats as null; exponent spelling can
+# differ (json 1e-07, orjson 1e-7) but decodes to the same value.
+default_ledger_encode: Callable[[Dict[str, Any]], bytes] = (
+    orjson.dumps if orjson is not None else _json_bytes
+)
+
+
+def _ledger_entry(event: RelationalEvent) -> Dict[str, Any]:
+    # Encoded right away, so the (possibly pooled) payload is not copied.
+    payload = event.payload
+    return {
+        "ts": event.timestamp / 1e9,  # seconds, as before
+        "type": EVENT_TYPE_NAMES[event.type],
+        "ctx_id": event.ctx_id,
+        "payload": payload if isinstance(payload, dict) else dict(payload),
+    }
+
+
 def attach_ledger_channel(
-    ledger_append: Callable[[Dict[str, Any]], None],
+    ledger_append: Callable[[bytes], None],
     bus: Optional[EventBus] = None,
+    encode: Callable[[Dict[str, Any]], bytes] = default_ledger_encode,
 ) -> int:
     """
     Mirror relational events into your ledger / audit log.
+
+    Each entry ({ts, type, ctx_id, payload}) is serialized once with encode
+    and ledger_append receives the resulting bytes. The dict handed to
+    encode is only valid for that call.
     """
     bus = bus or global_event_bus
 
     def _handler(event: RelationalEvent) -> None:
-        ledger_append(
-            {
-                "ts": event.timestamp,
-                "type": event.type.name,
-                "ctx_id": event.ctx_id,
-                "payload": event.payload,
-            }
-        )
+        ledger_append(encode(_ledger_entry(event)))
+
+    return bus.subscribe(_handler)
+
+
+def attach_ledger_channel_async(
+    ledger_append: Callable[[bytes], None],
+    bus: AsyncEventBus,
+    encode: Callable[[Dict[str, Any]], bytes] = default_ledger_encode,
+) -> int:
+    """
+    Mirror relational events from an AsyncEventBus into your ledger.
+
+    Entries are encoded as in attach_ledger_channel; ledger_append runs in a
+    worker thread (asyncio.to_thread), so blocking writes don't stall the
+    event loop.
+    """
+
+    async def _handler(event: RelationalEvent) -> None:
+        await asyncio.to_thread(ledger_append, encode(_ledger_entry(event)))
 
     return bus.subscribe(_handler)
 
@@ -210,6 +312,9 @@ def attach_lattice_channel(
     """
     Pass raw relational events into your lattice visualizer.
 
+    Each call gets its own copy of the event and payload, so the visualizer
+    may keep it (the bus's payload dicts can be reused after publish).
+
     You can adjust:
     - lower hemiplane coherence on GROUNDING_SHIFT
     - membrane brightness on SANCTUARY_GUARD
@@ -218,6 +323,6 @@ def attach_lattice_channel(
     bus = bus or global_event_bus
 
     def _handler(event: RelationalEvent) -> None:
-        apply_lattice_update(event)
+        apply_lattice_update(replace(event, payload=dict(event.payload)))
 
     return bus.subscribe(_handler)
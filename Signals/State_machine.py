@@ -1,8 +1,10 @@
 # signals/state_machine.py
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, Optional
 import json
 from pathlib import Path
 
@@ -73,8 +75,14 @@ class RelationalStateMachine:
     - sanctuary guard
 
     It decides *when* to emit relational events and with what payloads.
+
+    Payload dicts are pooled per event type and reused once publish returns,
+    so subscribers must not keep event.payload past their handler; copy it
+    (dict(event.payload)) if you need it later.
     """
 
+    PAYLOAD_POOL_SIZE = 4
+
     def __init__(
         self,
         thresholds: Thresholds,
@@ -82,6 +90,97 @@ class RelationalStateMachine:
     ) -> None:
         self.thresholds = thresholds
         self.bus = bus or global_event_bus
+        self._tick_ts: Optional[int] = None
+        self._pending: Optional[List[RelationalEvent]] = None
+        # The pooled dicts behind _pending, in the same order.
+        self._pending_payloads: List[Dict[str, Any]] = []
+        self._payload_pool: Dict[RelationalEventType, Deque[Dict[str, Any]]] = {
+            t: deque({} for _ in range(self.PAYLOAD_POOL_SIZE))
+            for t in RelationalEventType
+        }
+        # Band lookup tables, read from thresholds once at construction.
+        surprise = thresholds.surprise
+        self._eps_thresholds = [surprise.curious, surprise.tense, surprise.destabilized]
+        self._eps_labels = ["none", "curious", "tense", "destabilized"]
+        drag = thresholds.drag_cost
+        self._drag_thresholds = [drag.light, drag.moderate]
+        self._drag_labels = ["light", "moderate", "heavy"]
+
+    # --- Ticks -------------------------------------------------------------
+
+    def begin_tick(self) -> None:
+        """
+        Start a tick: read the clock once and hold events until flush().
+
+        Events emitted during the tick share one timestamp and are published
+        together with bus.publish_many(). Calling it again before flush()
+        flushes the open tick first.
+        """
+        if self._pending is not None:
+            self.flush()
+        self._tick_ts = now_ts()
+        self._pending = []
+
+    def flush(self) -> None:
+        """
+        Publish the events held since begin_tick() and end the tick.
+        """
+        pending = self._pending
+        payloads = self._pending_payloads
+        self._tick_ts = None
+        self._pending = None
+        self._pending_payloads = []
+        if not pending:
+            return
+        try:
+            self.bus.publish_many(pending)
+        finally:
+            for event, payload in zip(pending, payloads):
+                self._release_payload(event.type, payload)
+
+    # --- Emission -----------------------------------------------------------
+
+    def _acquire_payload(self, event_type: RelationalEventType) -> Dict[str, Any]:
+        pool = self._payload_pool[event_type]
+        if pool:
+            payload = pool.pop()
+            payload.clear()
+            return payload
+        # Pool drained (re-entrant or batched emission); use a fresh dict.
+        return {}
+
+    def _release_payload(
+        self,
+        event_type: RelationalEventType,
+        payload: Dict[str, Any],
+    ) -> None:
+        pool = self._payload_pool[event_type]
+        if len(pool) < self.PAYLOAD_POOL_SIZE:
+            pool.append(payload)
+
+    def _emit(
+        self,
+        event_type: RelationalEventType,
+        ctx_id: str,
+        payload: Dict[str, Any],
+    ) -> None:
+        ts = self._tick_ts
+        if ts is None:
+            ts = now_ts()
+        event = RelationalEvent(
+            type=event_type,
+            timestamp=ts,
+            ctx_id=ctx_id,
+            payload=payload,
+        )
+        if self._pending is not None:
+            self._pending.append(event)
+            self._pending_payloads.append(payload)
+            return
+        try:
+            self.bus.publish(event)
+        finally:
+            self._release_payload(event_type, payload)
 
     # --- Surprise / ε ------------------------------------------------------
 
@@ -96,36 +195,17 @@ class RelationalStateMachine:
 
         Emits SURPRISE_SPIKE when crossing meaningful bands upward.
         """
-        bands = self.thresholds.surprise
-        level = None
-
-        def band(e: float) -> str:
-            if e < bands.curious:
-                return "none"
-            if e < bands.tense:
-                return "curious"
-            if e < bands.destabilized:
-                return "tense"
-            return "destabilized"
-
-        prev_band = band(prev_epsilon)
-        new_band = band(epsilon)
-
-        if new_band == "none" or new_band == prev_band:
+        thresholds = self._eps_thresholds
+        new_band = bisect_right(thresholds, epsilon)
+        # Band 0 is "none"; calm updates stop before the second bisect.
+        if new_band == 0 or new_band == bisect_right(thresholds, prev_epsilon):
             return
 
-        level = new_band
-        event = RelationalEvent(
-            type=RelationalEventType.SURPRISE_SPIKE,
-            timestamp=now_ts(),
-            ctx_id=ctx_id,
-            payload={
-                "epsilon": epsilon,
-                "prev_epsilon": prev_epsilon,
-                "level": level,
-            },
-        )
-        self.bus.publish(event)
+        payload = self._acquire_payload(RelationalEventType.SURPRISE_SPIKE)
+        payload["epsilon"] = epsilon
+        payload["prev_epsilon"] = prev_epsilon
+        payload["level"] = self._eps_labels[new_band]
+        self._emit(RelationalEventType.SURPRISE_SPIKE, ctx_id, payload)
 
     # --- Grounding / Vitals -------------------------------------------------
 
@@ -152,21 +232,15 @@ class RelationalStateMachine:
 
         direction = "up" if (ds + dr) > 0 else "down"
 
-        event = RelationalEvent(
-            type=RelationalEventType.GROUNDING_SHIFT,
-            timestamp=now_ts(),
-            ctx_id=ctx_id,
-            payload={
-                "prev_safety": prev_safety,
-                "new_safety": new_safety,
-                "prev_regulation": prev_regulation,
-                "new_regulation": new_regulation,
-                "delta_safety": ds,
-                "delta_regulation": dr,
-                "direction": direction,
-            },
-        )
-        self.bus.publish(event)
+        payload = self._acquire_payload(RelationalEventType.GROUNDING_SHIFT)
+        payload["prev_safety"] = prev_safety
+        payload["new_safety"] = new_safety
+        payload["prev_regulation"] = prev_regulation
+        payload["new_regulation"] = new_regulation
+        payload["delta_safety"] = ds
+        payload["delta_regulation"] = dr
+        payload["direction"] = direction
+        self._emit(RelationalEventType.GROUNDING_SHIFT, ctx_id, payload)
 
     # --- Gate drag / consent cost ------------------------------------------
 
@@ -180,26 +254,14 @@ class RelationalStateMachine:
         """
         Called when a high-risk consent gate crossing is *considered* or executed.
         """
-        bands = self.thresholds.drag_cost
-        if cost < bands.light:
-            level = "light"
-        elif cost < bands.moderate:
-            level = "moderate"
-        else:
-            level = "heavy"
+        level = self._drag_labels[bisect_right(self._drag_thresholds, cost)]
 
-        event = RelationalEvent(
-            type=RelationalEventType.GATE_DRAG,
-            timestamp=now_ts(),
-            ctx_id=ctx_id,
-            payload={
-                "gate_id": gate_id,
-                "cost": cost,
-                "energy_class": energy_class,
-                "level": level,
-            },
-        )
-        self.bus.publish(event)
+        payload = self._acquire_payload(RelationalEventType.GATE_DRAG)
+        payload["gate_id"] = gate_id
+        payload["cost"] = cost
+        payload["energy_class"] = energy_class
+        payload["level"] = level
+        self._emit(RelationalEventType.GATE_DRAG, ctx_id, payload)
 
     # --- Pocket rooms -------------------------------------------------------
 
@@ -210,17 +272,11 @@ class RelationalStateMachine:
         reason: str,
         depth: int,
     ) -> None:
-        event = RelationalEvent(
-            type=RelationalEventType.POCKET_SPAWN,
-            timestamp=now_ts(),
-            ctx_id=ctx_id,
-            payload={
-                "room_id": room_id,
-                "reason": reason,
-                "depth": depth,
-            },
-        )
-        self.bus.publish(event)
+        payload = self._acquire_payload(RelationalEventType.POCKET_SPAWN)
+        payload["room_id"] = room_id
+        payload["reason"] = reason
+        payload["depth"] = depth
+        self._emit(RelationalEventType.POCKET_SPAWN, ctx_id, payload)
 
     def on_pocket_merge(
         self,
@@ -230,18 +286,12 @@ class RelationalStateMachine:
         delta_consent: float,
         delta_regulation: float,
     ) -> None:
-        event = RelationalEvent(
-            type=RelationalEventType.POCKET_MERGE,
-            timestamp=now_ts(),
-            ctx_id=ctx_id,
-            payload={
-                "room_id": room_id,
-                "delta_safety": delta_safety,
-                "delta_consent": delta_consent,
-                "delta_regulation": delta_regulation,
-            },
-        )
-        self.bus.publish(event)
+        payload = self._acquire_payload(RelationalEventType.POCKET_MERGE)
+        payload["room_id"] = room_id
+        payload["delta_safety"] = delta_safety
+        payload["delta_consent"] = delta_consent
+        payload["delta_regulation"] = delta_regulation
+        self._emit(RelationalEventType.POCKET_MERGE, ctx_id, payload)
 
     def on_pocket_archive(
         self,
@@ -249,16 +299,10 @@ class RelationalStateMachine:
         room_id: str,
         reason: str,
     ) -> None:
-        event = RelationalEvent(
-            type=RelationalEventType.POCKET_ARCHIVE,
-            timestamp=now_ts(),
-            ctx_id=ctx_id,
-            payload={
-                "room_id": room_id,
-                "reason": reason,
-            },
-        )
-        self.bus.publish(event)
+        payload = self._acquire_payload(RelationalEventType.POCKET_ARCHIVE)
+        payload["room_id"] = room_id
+        payload["reason"] = reason
+        self._emit(RelationalEventType.POCKET_ARCHIVE, ctx_id, payload)
 
     # --- Sanctuary guard ----------------------------------------------------
 
@@ -267,15 +311,9 @@ class RelationalStateMachine:
         ctx_id: str,
         state: str,  # "active" | "released"
     ) -> None:
-        event = RelationalEvent(
-            type=RelationalEventType.SANCTUARY_GUARD,
-            timestamp=now_ts(),
-            ctx_id=ctx_id,
-            payload={
-                "state": state,
-            },
-        )
-        self.bus.publish(event)
+        payload = self._acquire_payload(RelationalEventType.SANCTUARY_GUARD)
+        payload["state"] = state
+        self._emit(RelationalEventType.SANCTUARY_GUARD, ctx_id, payload)
 
 
 def load_default_thresholds() -> Thresholds:
@@ -0,0 +1,27 @@
+# signals/_event_bus.pyx
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled fan-out loops for EventBus.publish / publish_many.
+
+Optional: build in place with `cythonize -i signals/_event_bus.pyx`.
+event_bus falls back to its pure-Python loop when this isn't built.
+"""
+
+
+def dispatch(tuple callbacks, object event):
+    """
+    Call every callback in the per-type snapshot with event.
+    """
+    cdef object cb
+    for cb in callbacks:
+        cb(event)
+
+
+def dispatch_many(dict cached_by_type, events):
+    """
+    Fan out each event in order against one per-type snapshot.
+    """
+    cdef object event, cb
+    for event in events:
+        for cb in <tuple>cached_by_type[event.type]:
+            cb(event)
@@ -1,13 +1,13 @@
 # signals/avatar_micro.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, fields
+from typing import Dict, Optional, Tuple
 
-from .event_bus import RelationalEvent, RelationalEventType
+from .event_bus import EVENT_TAG_KEYS, RelationalEvent, RelationalEventType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AvatarGesturePlan:
     """
     High-level micro-gesture description.
@@ -25,104 +25,118 @@ class AvatarGesturePlan:
     shield_up: bool = False
 
 
+_SPIKE = RelationalEventType.SURPRISE_SPIKE
+_GROUNDING = RelationalEventType.GROUNDING_SHIFT
+_DRAG = RelationalEventType.GATE_DRAG
+_GUARD = RelationalEventType.SANCTUARY_GUARD
+
+# The whole plan vocabulary, built once and shared by every event.
+_CURIOUS = AvatarGesturePlan(
+    freeze_ms=80,
+    inhale=True,
+    gaze_flicker=True,
+)
+_TENSE = AvatarGesturePlan(
+    freeze_ms=120,
+    inhale=True,
+    gaze_flicker=True,
+    shoulders_close=True,
+    weight_shift_back=True,
+)
+_DESTABILIZED = AvatarGesturePlan(
+    freeze_ms=180,
+    inhale=True,
+    gaze_flicker=True,
+    shoulders_close=True,
+    weight_shift_back=True,
+    head_tilt_down=True,
+)
+_OPENING = AvatarGesturePlan(
+    sternum_lift=True,
+    shoulders_release=True,
+)
+_CLOSING = AvatarGesturePlan(
+    shoulders_close=True,
+    head_tilt_down=True,
+)
+_DRAG_MODERATE = AvatarGesturePlan(
+    weight_shift_back=True,
+)
+_DRAG_HEAVY = AvatarGesturePlan(
+    weight_shift_back=True,
+    shoulders_close=True,
+)
+_STEP_ASIDE = AvatarGesturePlan(
+    freeze_ms=100,
+    head_tilt_down=True,
+)
+_SHIELD_UP = AvatarGesturePlan(
+    shield_up=True,
+    shoulders_close=True,
+    weight_shift_back=True,
+)
+_SHIELD_DOWN = AvatarGesturePlan(
+    shield_up=False,
+    shoulders_release=True,
+)
+
+# (type, event tag) -> plan. The (type, None) entry is the fallback for
+# tags that have no entry of their own.
+_PLAN_TABLE: Dict[Tuple[RelationalEventType, Optional[str]], AvatarGesturePlan] = {
+    (_SPIKE, "curious"): _CURIOUS,
+    (_SPIKE, "tense"): _TENSE,
+    (_SPIKE, None): _DESTABILIZED,
+    (_GROUNDING, "up"): _OPENING,
+    (_GROUNDING, None): _CLOSING,
+    (_DRAG, "moderate"): _DRAG_MODERATE,
+    (_DRAG, "heavy"): _DRAG_HEAVY,
+    (RelationalEventType.POCKET_SPAWN, None): _STEP_ASIDE,
+    (RelationalEventType.POCKET_MERGE, None): _OPENING,
+    (RelationalEventType.POCKET_ARCHIVE, None): _CLOSING,
+    (_GUARD, "active"): _SHIELD_UP,
+    (_GUARD, None): _SHIELD_DOWN,
+}
+
+
+def _debug_string(plan: AvatarGesturePlan) -> str:
+    active = [
+        f.name for f in fields(plan)
+        if isinstance(getattr(plan, f.name), bool) and getattr(plan, f.name)
+    ]
+    if plan.freeze_ms:
+        active.append(f"freeze={plan.freeze_ms}ms")
+    return ", ".join(active)
+
+
+# Debug strings of the shared plans, keyed by id() (the plans live forever).
+_PLAN_DEBUG: Dict[int, str] = {
+    id(plan): _debug_string(plan) for plan in _PLAN_TABLE.values()
+}
+
+
 class AvatarMicroEngine:
     """
     Listens to relational events and computes small, honest physical responses.
     """
 
+    # Event types that can produce a plan; subscribe only to these.
+    event_types: Tuple[RelationalEventType, ...] = tuple(
+        dict.fromkeys(t for t, _ in _PLAN_TABLE)
+    )
+
     def plan_for_event(self, event: RelationalEvent) -> Optional[AvatarGesturePlan]:
         t = event.type
-        p = event.payload
-
-        if t == RelationalEventType.SURPRISE_SPIKE:
-            level = p.get("level")
-            if level == "curious":
-                return AvatarGesturePlan(
-                    freeze_ms=80,
-                    inhale=True,
-                    gaze_flicker=True,
-                )
-            if level == "tense":
-                return AvatarGesturePlan(
-                    freeze_ms=120,
-                    inhale=True,
-                    gaze_flicker=True,
-                    shoulders_close=True,
-                    weight_shift_back=True,
-                )
-            return AvatarGesturePlan(
-                freeze_ms=180,
-                inhale=True,
-                gaze_flicker=True,
-                shoulders_close=True,
-                weight_shift_back=True,
-                head_tilt_down=True,
-            )
-
-        if t == RelationalEventType.GROUNDING_SHIFT:
-            direction = p.get("direction")
-            if direction == "up":
-                return AvatarGesturePlan(
-                    sternum_lift=True,
-                    shoulders_release=True,
-                )
-            else:
-                return AvatarGesturePlan(
-                    shoulders_close=True,
-                    head_tilt_down=True,
-                )
-
-        if t == RelationalEventType.GATE_DRAG:
-            level = p.get("level")
-            if level == "moderate":
-                return AvatarGesturePlan(
-                    weight_shift_back=True,
-                )
-            if level == "heavy":
-                return AvatarGesturePlan(
-                    weight_shift_back=True,
-                    shoulders_close=True,
-                )
-
-        if t == RelationalEventType.POCKET_SPAWN:
-            return AvatarGesturePlan(
-                freeze_ms=100,
-                head_tilt_down=True,
-            )
-
-        if t == RelationalEventType.POCKET_MERGE:
-            return AvatarGesturePlan(
-                sternum_lift=True,
-                shoulders_release=True,
-            )
-
-        if t == RelationalEventType.POCKET_ARCHIVE:
-            return AvatarGesturePlan(
-                head_tilt_down=True,
-                shoulders_close=True,
-            )
-
-        if t == RelationalEventType.SANCTUARY_GUARD:
-            state = p.get("state")
-            if state == "active":
-                return AvatarGesturePlan(
-                    shield_up=True,
-                    shoulders_close=True,
-                    weight_shift_back=True,
-                )
-            else:
-                return AvatarGesturePlan(
-                    shield_up=False,
-                    shoulders_release=True,
-                )
-
-        return None
+        key = EVENT_TAG_KEYS[t]  # sub-band field, see EVENT_TAG_KEYS
+        tag = event.payload.get(key) if key else None
+        # Only str tags have entries; anything else (possibly unhashable)
+        # goes straight to the type's fallback.
+        plan = _PLAN_TABLE.get((t, tag)) if isinstance(tag, str) else None
+        if plan is None:
+            plan = _PLAN_TABLE.get((t, None))
+        return plan
 
     def to_debug_string(self, plan: AvatarGesturePlan) -> str:
-        active = [
-            name for name, value in vars(plan).items()
-            if isinstance(value, bool) and value
-        ]
-        if plan.freeze_ms:
-            active.append(f"freeze={plan.freeze_ms}ms")
-        return ", ".join(active)
+        debug = _PLAN_DEBUG.get(id(plan))
+        if debug is None:
+            debug = _debug_string(plan)
+        return debug
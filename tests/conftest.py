@@ -0,0 +1,38 @@
+import pytest
+
+from signals.event_bus import EventBus, RelationalEvent, RelationalEventType
+from signals.state_machine import (
+    DragBands,
+    GroundingBands,
+    RelationalStateMachine,
+    SurpriseBands,
+    Thresholds,
+)
+
+
+# Same values as Signals/Thresholds.json.
+THRESHOLDS = Thresholds(
+    surprise=SurpriseBands(curious=0.15, tense=0.35, destabilized=0.55),
+    drag_cost=DragBands(light=10, moderate=40),
+    grounding=GroundingBands(min_delta=0.03),
+)
+
+
+@pytest.fixture
+def make_event():
+    def _make(event_type: RelationalEventType, **payload) -> RelationalEvent:
+        return RelationalEvent(
+            type=event_type, timestamp=0, ctx_id="ctx", payload=payload
+        )
+
+    return _make
+
+
+@pytest.fixture
+def bus() -> EventBus:
+    return EventBus()
+
+
+@pytest.fixture
+def machine(bus: EventBus) -> RelationalStateMachine:
+    return RelationalStateMachine(THRESHOLDS, bus)
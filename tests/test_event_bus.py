@@ -0,0 +1,156 @@
+import asyncio
+import threading
+
+import pytest
+
+from signals.event_bus import AsyncEventBus, RelationalEventType
+
+
+def test_publish_reaches_typed_and_wildcard_subscribers(bus, make_event):
+    seen = []
+    bus.subscribe(lambda e: seen.append(("typed", e.type)), [RelationalEventType.GATE_DRAG])
+    bus.subscribe(lambda e: seen.append(("all", e.type)))
+
+    bus.publish(make_event(RelationalEventType.GATE_DRAG))
+    bus.publish(make_event(RelationalEventType.POCKET_SPAWN))
+
+    assert seen == [
+        ("typed", RelationalEventType.GATE_DRAG),
+        ("all", RelationalEventType.GATE_DRAG),
+        ("all", RelationalEventType.POCKET_SPAWN),
+    ]
+
+
+def test_unsubscribe_stops_delivery_and_ignores_unknown_tokens(bus, make_event):
+    seen = []
+    typed = bus.subscribe(lambda e: seen.append("typed"), [RelationalEventType.GATE_DRAG])
+    wildcard = bus.subscribe(lambda e: seen.append("all"))
+
+    bus.unsubscribe(typed)
+    bus.unsubscribe(typed)
+    bus.unsubscribe(12345)
+    bus.publish(make_event(RelationalEventType.GATE_DRAG))
+    bus.unsubscribe(wildcard)
+    bus.publish(make_event(RelationalEventType.GATE_DRAG))
+
+    assert seen == ["all"]
+
+
+def test_subscribing_during_publish_applies_from_next_publish(bus, make_event):
+    seen = []
+
+    def _handler(event):
+        seen.append("first")
+        bus.subscribe(lambda e: seen.append("late"))
+
+    token = bus.subscribe(_handler)
+    bus.publish(make_event(RelationalEventType.GATE_DRAG))
+    bus.unsubscribe(token)
+    bus.publish(make_event(RelationalEventType.GATE_DRAG))
+
+    assert seen == ["first", "late"]
+
+
+def test_async_bus_delivers_to_matching_subscribers(make_event):
+    async def _run():
+        bus = AsyncEventBus()
+        seen = []
+
+        async def _typed(event):
+            seen.append(("typed", event.type))
+
+        bus.subscribe(_typed, [RelationalEventType.GATE_DRAG])
+        bus.subscribe(lambda e: seen.append(("all", e.type)))
+        bus.publish(make_event(RelationalEventType.GATE_DRAG))
+        bus.publish(make_event(RelationalEventType.POCKET_SPAWN))
+        await asyncio.wait_for(bus.drain(), 1)
+        return seen
+
+    seen = asyncio.run(_run())
+
+    assert sorted(seen, key=str) == sorted(
+        [
+            ("typed", RelationalEventType.GATE_DRAG),
+            ("all", RelationalEventType.GATE_DRAG),
+            ("all", RelationalEventType.POCKET_SPAWN),
+        ],
+        key=str,
+    )
+
+
+def test_async_unsubscribe_releases_pending_drain(make_event):
+    async def _run():
+        bus = AsyncEventBus()
+
+        async def _slow(event):
+            await asyncio.sleep(10)
+
+        token = bus.subscribe(_slow)
+        for _ in range(3):
+            bus.publish(make_event(RelationalEventType.GATE_DRAG))
+        drain = asyncio.ensure_future(bus.drain())
+        await asyncio.sleep(0.01)
+        bus.unsubscribe(token)
+        await asyncio.wait_for(drain, 1)
+
+    asyncio.run(_run())
+
+
+def test_queued_subscriber_runs_on_worker_thread(bus, make_event):
+    done = threading.Event()
+    seen = []
+
+    def _handler(event):
+        seen.append((event.payload["n"], threading.current_thread().name))
+        done.set()
+
+    token = bus.subscribe(_handler, queue=True)
+    bus.publish(make_event(RelationalEventType.GATE_DRAG, n=1))
+    assert done.wait(1)
+    bus.unsubscribe(token)
+
+    assert seen[0][0] == 1
+    assert seen[0][1] != threading.current_thread().name
+
+
+def test_max_backlog_requires_queue(bus):
+
+    with pytest.raises(ValueError):
+        bus.subscribe(lambda e: None, max_backlog=4)
+
+
+def test_max_backlog_keeps_newest_events_after_stall(bus, make_event):
+    started = threading.Event()
+    release = threading.Event()
+    done = threading.Event()
+    seen = []
+
+    def _handler(event):
+        n = event.payload["n"]
+        seen.append(n)
+        if n == "stall":
+            started.set()
+            release.wait(1)
+        elif n == 9:
+            done.set()
+
+    token = bus.subscribe(_handler, queue=True, max_backlog=2)
+    bus.publish(make_event(RelationalEventType.GATE_DRAG, n="stall"))
+    assert started.wait(1)
+    for n in range(10):
+        bus.publish(make_event(RelationalEventType.GATE_DRAG, n=n))
+    release.set()
+    assert done.wait(1)
+    bus.unsubscribe(token)
+
+    assert seen == ["stall", 7, 8, 9]
+
+
+def test_invalid_event_types_start_no_worker(bus):
+    before = threading.active_count()
+
+    with pytest.raises(KeyError):
+        bus.subscribe(lambda e: None, event_types=["not-a-type"], queue=True)
+
+    assert bus._worker_queues == {}
+    assert threading.active_count() == before
@@ -0,0 +1,86 @@
+import json
+import math
+import time
+
+import pytest
+
+from signals.avatar_micro import AvatarMicroEngine
+from signals.event_bus import RelationalEventType
+from signals.integration_hooks import (
+    _json_bytes,
+    attach_lattice_channel,
+    attach_ledger_channel,
+    event_to_utterance,
+)
+
+
+def test_lattice_channel_events_survive_payload_reuse(bus, machine):
+    kept = []
+    attach_lattice_channel(kept.append, bus)
+
+    states = ["a", "b", "c", "d", "e"]
+    for state in states:
+        machine.on_sanctuary_guard("ctx", state=state)
+
+    assert [e.type for e in kept] == [RelationalEventType.SANCTUARY_GUARD] * 5
+    assert [e.payload["state"] for e in kept] == states
+
+
+def test_utterance_tags_pick_entry_or_fallback(make_event):
+    spike = RelationalEventType.SURPRISE_SPIKE
+    drag = RelationalEventType.GATE_DRAG
+
+    assert event_to_utterance(make_event(spike, level="curious")) == (
+        "A moment—something shifted inside me."
+    )
+    assert event_to_utterance(make_event(spike, level="destabilized")) == (
+        "I just felt a sharp internal tension."
+    )
+    assert event_to_utterance(make_event(drag, level="light")) is None
+
+
+def test_utterance_unhashable_tag_falls_back(make_event):
+    event = make_event(RelationalEventType.SURPRISE_SPIKE, level=["x"])
+
+    assert event_to_utterance(event) == "I just felt a sharp internal tension."
+
+
+def test_avatar_plan_unhashable_tag_falls_back(make_event):
+    engine = AvatarMicroEngine()
+    spike = RelationalEventType.SURPRISE_SPIKE
+
+    fallback = engine.plan_for_event(make_event(spike, level="destabilized"))
+
+    assert engine.plan_for_event(make_event(spike, level=["x"])) is fallback
+    light = make_event(RelationalEventType.GATE_DRAG, level="light")
+    assert engine.plan_for_event(light) is None
+
+
+def test_ledger_entry_encodes_event(bus, machine):
+    orjson = pytest.importorskip("orjson")
+    lines = []
+    attach_ledger_channel(lines.append, bus)
+
+    before = time.time()
+    machine.on_gate_drag("ctx", gate_id="g", cost=50, energy_class="macro")
+
+    (line,) = lines
+    entry = json.loads(line)
+    assert before - 1 <= entry["ts"] <= time.time() + 1
+    assert entry["type"] == "GATE_DRAG"
+    assert entry["ctx_id"] == "ctx"
+    assert entry["payload"] == {
+        "gate_id": "g",
+        "cost": 50,
+        "energy_class": "macro",
+        "level": "heavy",
+    }
+    assert _json_bytes(entry) == orjson.dumps(entry) == line
+
+
+def test_json_fallback_matches_orjson_on_floats():
+    orjson = pytest.importorskip("orjson")
+    entry = {"nan": math.nan, "inf": [math.inf, -math.inf], "tiny": 1e-7}
+
+    assert json.loads(_json_bytes(entry)) == json.loads(orjson.dumps(entry))
+    assert _json_bytes({"a": math.nan}) == orjson.dumps({"a": math.nan})
@@ -0,0 +1,53 @@
+from signals.event_bus import RelationalEventType
+
+
+def test_epsilon_bands_emit_on_band_change_only(bus, machine):
+    levels = []
+    bus.subscribe(lambda e: levels.append(e.payload["level"]))
+
+    machine.on_epsilon_update("ctx", 0.15, 0.0)
+    machine.on_epsilon_update("ctx", 0.2, 0.15)
+    machine.on_epsilon_update("ctx", 0.55, 0.2)
+    machine.on_epsilon_update("ctx", 0.1, 0.55)
+
+    assert levels == ["curious", "destabilized"]
+
+
+def test_gate_drag_levels(bus, machine):
+    levels = []
+    bus.subscribe(lambda e: levels.append(e.payload["level"]))
+
+    for cost in (0, 10, 39, 40):
+        machine.on_gate_drag("ctx", gate_id="g", cost=cost, energy_class="macro")
+
+    assert levels == ["light", "moderate", "moderate", "heavy"]
+
+
+def test_tick_batches_events_until_flush(bus, machine):
+    seen = []
+    bus.subscribe(lambda e: seen.append((e.timestamp, e.payload["state"])))
+
+    machine.begin_tick()
+    machine.on_sanctuary_guard("ctx", state="active")
+    machine.on_sanctuary_guard("ctx", state="released")
+    assert seen == []
+    machine.flush()
+
+    assert [state for _, state in seen] == ["active", "released"]
+    assert len({ts for ts, _ in seen}) == 1
+
+
+def test_nested_begin_tick_flushes_open_tick(bus, machine):
+    seen = []
+    bus.subscribe(lambda e: seen.append(e.payload["state"]))
+
+    machine.begin_tick()
+    machine.on_sanctuary_guard("ctx", state="active")
+    machine.begin_tick()
+    assert seen == ["active"]
+    machine.on_sanctuary_guard("ctx", state="released")
+    machine.flush()
+
+    assert seen == ["active", "released"]
+    pool = machine._payload_pool[RelationalEventType.SANCTUARY_GUARD]
+    assert len(pool) == machine.PAYLOAD_POOL_SIZE